@@ -63,6 +63,7 @@ public:
         
         uint32_t num_docs = decode_uint32(data + offset, pos);
         uint32_t last_docid = 0;
+        docids.reserve(num_docs);
         
         for (uint32_t i = 0; i < num_docs; i++) {
             uint32_t delta = decode_uint32(data + offset, pos);
@@ -101,6 +102,51 @@ private:
     // Barrel data cache
     unordered_map<uint32_t, vector<uint8_t>> barrel_cache;
     
+    // Query result cache (LRU), keyed on normalized query + top_k
+    static const size_t MAX_CACHED_QUERIES = 1024;
+    struct CachedResult {
+        vector<SearchResult> results;
+        list<string>::iterator lru_pos;
+    };
+    unordered_map<string, CachedResult> result_cache;
+    list<string> result_lru;
+    bool result_cache_enabled = true;
+    
+    // Helper: Build cache key from tokens so "Cancer" and "cancer" share an entry
+    string make_cache_key(const vector<string>& tokens, size_t top_k) {
+        string key = to_string(top_k);
+        for (const auto& t : tokens) {
+            key += ' ';
+            key += t;
+        }
+        return key;
+    }
+    
+    // Helper: Look up cached results, updating LRU order on hit
+    bool get_cached(const string& key, vector<SearchResult>& out) {
+        if (!result_cache_enabled) return false;
+        
+        auto it = result_cache.find(key);
+        if (it == result_cache.end()) return false;
+        
+        result_lru.splice(result_lru.begin(), result_lru, it->second.lru_pos);
+        out = it->second.results;
+        return true;
+    }
+    
+    // Helper: Store results, evicting the least recently used entry if full
+    void put_cached(const string& key, const vector<SearchResult>& results) {
+        if (!result_cache_enabled) return;
+        
+        if (result_cache.size() >= MAX_CACHED_QUERIES) {
+            result_cache.erase(result_lru.back());
+            result_lru.pop_back();
+        }
+        
+        result_lru.push_front(key);
+        result_cache[key] = CachedResult{results, result_lru.begin()};
+    }
+    
     // Helper: Load barrel
     bool load_barrel(uint32_t barrel_id) {
         if (barrel_cache.find(barrel_id) != barrel_cache.end()) {
@@ -122,23 +168,28 @@ private:
         return true;
     }
     
-    // Helper: Get posting list for a term
-    vector<uint32_t> get_posting_list(const string& term) {
+    // Helper: Get posting list for a term.
+    // Returns false only if the term's barrel could not be loaded; a term
+    // missing from the lexicon yields an empty list and returns true.
+    bool get_posting_list(const string& term, vector<uint32_t>& postings) {
+        postings.clear();
+        
         auto it = lexicon.find(term);
-        if (it == lexicon.end()) return {};
+        if (it == lexicon.end()) return true;
         
         LexiconEntry& entry = it->second;
         
         // Load barrel if needed
         if (!load_barrel(entry.barrel_id)) {
             cerr << "[QueryEngine] Failed to load barrel " << entry.barrel_id << "\n";
-            return {};
+            return false;
         }
         
         const auto& barrel_data = barrel_cache[entry.barrel_id];
-        return VByteDecoder::decode_posting_list(
+        postings = VByteDecoder::decode_posting_list(
             barrel_data.data(), entry.offset, entry.bytes
         );
+        return true;
     }
     
     // Helper: Calculate BM25 score
@@ -182,6 +233,9 @@ public:
     bool load_index() {
         auto start = chrono::high_resolution_clock::now();
         
+        // Results cached against a previous (or missing) index are stale
+        clear_result_cache();
+        
         // Load lexicon
         string lexicon_path = index_dir + "/lexicon.txt";
         ifstream lex_ifs(lexicon_path);
@@ -271,20 +325,69 @@ public:
         return true;
     }
     
+    // Drop all cached query results
+    void clear_result_cache() {
+        result_cache.clear();
+        result_lru.clear();
+    }
+    
+    // Turn query result caching on or off; disabling also clears the cache
+    void set_result_cache_enabled(bool enabled) {
+        result_cache_enabled = enabled;
+        if (!enabled) clear_result_cache();
+    }
+    
+    // Load every barrel referenced by the lexicon so the first queries
+    // don't pay for disk reads
+    size_t preload_barrels() {
+        auto start = chrono::high_resolution_clock::now();
+        
+        set<uint32_t> barrel_ids;
+        for (const auto& p : lexicon) {
+            barrel_ids.insert(p.second.barrel_id);
+        }
+        
+        size_t loaded = 0;
+        for (uint32_t barrel_id : barrel_ids) {
+            if (load_barrel(barrel_id)) {
+                loaded++;
+            } else {
+                cerr << "[QueryEngine] Failed to preload barrel " << barrel_id << "\n";
+            }
+        }
+        
+        auto end = chrono::high_resolution_clock::now();
+        auto duration = chrono::duration_cast<chrono::milliseconds>(end - start);
+        
+        cerr << "[QueryEngine] Preloaded " << loaded << " barrels in " << duration.count() << "ms\n";
+        return loaded;
+    }
+    
     // Single-word search
     vector<SearchResult> search_single(const string& query, size_t top_k = 10) {
         vector<string> tokens = tokenize_query(query);
         if (tokens.empty()) return {};
         
         string term = tokens[0];
-        auto postings = get_posting_list(term);
         
-        if (postings.empty()) return {};
+        string cache_key = make_cache_key({term}, top_k);
+        vector<SearchResult> cached;
+        if (get_cached(cache_key, cached)) return cached;
+        
+        // Don't cache a failed barrel load, so the next query retries it
+        vector<uint32_t> postings;
+        if (!get_posting_list(term, postings)) return {};
+        
+        if (postings.empty()) {
+            put_cached(cache_key, {});
+            return {};
+        }
         
         auto it = lexicon.find(term);
         uint32_t doc_freq = it->second.doc_freq;
         
         vector<SearchResult> results;
+        results.reserve(postings.size());
         
         for (uint32_t docid : postings) {
             SearchResult result;
@@ -294,7 +397,7 @@ public:
             uint32_t doc_len = doc_lengths.count(docid) ? doc_lengths[docid] : avg_doc_length;
             result.score = calculate_bm25(doc_freq, 1, doc_len, total_docs);
             
-            results.push_back(result);
+            results.push_back(move(result));
         }
         
         sort(results.begin(), results.end());
@@ -303,6 +406,7 @@ public:
             results.resize(top_k);
         }
         
+        put_cached(cache_key, results);
         return results;
     }
     
@@ -315,34 +419,74 @@ public:
             return search_single(query, top_k);
         }
         
-        // Get posting lists for all terms
+        string cache_key = make_cache_key(tokens, top_k);
+        vector<SearchResult> cached;
+        if (get_cached(cache_key, cached)) return cached;
+        
+        // Get posting lists for all terms, decoding each distinct term once.
+        // scored_terms keeps one entry per query token (in query order) so a
+        // repeated term still contributes to the score once per occurrence.
         vector<pair<string, vector<uint32_t>>> term_postings;
+        unordered_map<string, size_t> term_index;
+        vector<size_t> scored_terms;
+        bool all_loaded = true;
         
         for (const auto& term : tokens) {
-            auto postings = get_posting_list(term);
-            if (!postings.empty()) {
+            auto seen = term_index.find(term);
+            if (seen != term_index.end()) {
+                if (seen->second != SIZE_MAX) scored_terms.push_back(seen->second);
+                continue;
+            }
+            
+            vector<uint32_t> postings;
+            if (!get_posting_list(term, postings)) {
+                all_loaded = false;
+                term_index[term] = SIZE_MAX;
+            } else if (postings.empty()) {
+                term_index[term] = SIZE_MAX;
+            } else {
+                term_index[term] = term_postings.size();
+                scored_terms.push_back(term_postings.size());
                 term_postings.emplace_back(term, move(postings));
             }
         }
         
-        if (term_postings.empty()) return {};
-        
-        // Find intersection (documents containing all terms)
-        set<uint32_t> common_docs(term_postings[0].second.begin(), 
-                                   term_postings[0].second.end());
+        if (term_postings.empty()) {
+            if (all_loaded) put_cached(cache_key, {});
+            return {};
+        }
         
-        for (size_t i = 1; i < term_postings.size(); i++) {
-            set<uint32_t> current(term_postings[i].second.begin(), 
-                                 term_postings[i].second.end());
-            set<uint32_t> intersection;
+        // Find intersection (documents containing all terms).
+        // Posting lists are delta-decoded, so they are already sorted; merge
+        // them directly, starting from the shortest list to keep it small.
+        vector<size_t> order(term_postings.size());
+        iota(order.begin(), order.end(), 0);
+        sort(order.begin(), order.end(), [&](size_t a, size_t b) {
+            return term_postings[a].second.size() < term_postings[b].second.size();
+        });
+        
+        vector<uint32_t> common_docs = move(term_postings[order[0]].second);
+        vector<uint32_t> intersection;
+        
+        for (size_t i = 1; i < order.size() && !common_docs.empty(); i++) {
+            const auto& current = term_postings[order[i]].second;
+            intersection.clear();
             set_intersection(common_docs.begin(), common_docs.end(),
-                           current.begin(), current.end(),
-                           inserter(intersection, intersection.begin()));
-            common_docs = move(intersection);
+                             current.begin(), current.end(),
+                             back_inserter(intersection));
+            common_docs.swap(intersection);
         }
         
         // Calculate BM25 scores for common documents
         vector<SearchResult> results;
+        results.reserve(common_docs.size());
+        vector<double> term_scores(term_postings.size());
+        
+        // Document frequency of each distinct query term
+        vector<uint32_t> term_doc_freqs(term_postings.size());
+        for (size_t i = 0; i < term_postings.size(); i++) {
+            term_doc_freqs[i] = lexicon.find(term_postings[i].first)->second.doc_freq;
+        }
         
         for (uint32_t docid : common_docs) {
             SearchResult result;
@@ -351,17 +495,18 @@ public:
             
             uint32_t doc_len = doc_lengths.count(docid) ? doc_lengths[docid] : avg_doc_length;
             
-            // Sum BM25 scores for all query terms
-            for (const auto& tp : term_postings) {
-                auto it = lexicon.find(tp.first);
-                if (it != lexicon.end()) {
-                    uint32_t doc_freq = it->second.doc_freq;
-                    result.score += calculate_bm25(doc_freq, 1, doc_len, total_docs);
-                    result.term_frequencies[tp.first] = 1;
-                }
+            // BM25 score of each distinct query term
+            for (size_t i = 0; i < term_postings.size(); i++) {
+                term_scores[i] = calculate_bm25(term_doc_freqs[i], 1, doc_len, total_docs);
+                result.term_frequencies[term_postings[i].first] = 1;
+            }
+            
+            // Sum over all query tokens, so repeated terms count once per occurrence
+            for (size_t idx : scored_terms) {
+                result.score += term_scores[idx];
             }
             
-            results.push_back(result);
+            results.push_back(move(result));
         }
         
         sort(results.begin(), results.end());
@@ -370,6 +515,8 @@ public:
             results.resize(top_k);
         }
         
+        // Results missing a term whose barrel failed to load are not cached
+        if (all_loaded) put_cached(cache_key, results);
         return results;
     }
     
@@ -401,6 +548,7 @@ public:
         cout << "Total documents: " << total_docs << "\n";
         cout << "Avg document length: " << avg_doc_length << "\n";
         cout << "Barrels loaded: " << barrel_cache.size() << "\n";
+        cout << "Cached queries: " << result_cache.size() << "\n";
         cout << "========================\n\n";
     }
 };